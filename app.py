@@ -5,35 +5,96 @@ Accepts POST requests, generates apps using LLM, creates GitHub repos, and submi
 """
 
 import os
-import json
+import sys
+import atexit
 import logging
-from flask import Flask, request, jsonify
+import asyncio
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, request
 from datetime import datetime
 import threading
 
+import orjson
+
 from config import Config
 from github_manager import GitHubManager
 from llm_generator import LLMGenerator
 from evaluator import Evaluator
 
-# Configure logging
+# Configure logging. Request handlers only enqueue records; a single
+# listener thread does the actual file/console writes, so logging on the
+# hot path never blocks on I/O or contends on the handler lock
+os.makedirs('logs', exist_ok=True)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('logs/api.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+# Drain whatever is still queued before the interpreter exits - without
+# this, tail records (including fatal startup errors) can be dropped
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/api.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 config = Config()
 
+# Fail fast on missing credentials - a misconfigured server would accept
+# requests and burn a worker on processing guaranteed to fail
+try:
+    config.validate()
+except ValueError as e:
+    # Hit stderr directly as well - the queued record alone could be
+    # lost if the listener thread never gets to drain it
+    print(f"FATAL: {e}", file=sys.stderr)
+    logger.critical(str(e))
+    sys.exit(1)
+
+# One background event loop shared by all requests; in-flight deployments
+# multiplex on it as coroutines instead of each holding its own OS thread
+_loop = asyncio.new_event_loop()
+
+# The blocking SDK/git phases run on this dedicated executor. The loop's
+# stock default caps at min(32, cpus + 4) threads, which on a small
+# container would throttle deployments to single digits
+_WORKER_THREADS = int(os.getenv('WORKER_THREADS', 64))
+_loop.set_default_executor(
+    ThreadPoolExecutor(max_workers=_WORKER_THREADS, thread_name_prefix='deploy'))
+
+threading.Thread(target=_loop.run_forever, daemon=True, name='worker-loop').start()
+
+# Backpressure: cap in-flight deployments against real capacity. Each
+# deployment needs a worker thread for its blocking phases, so accept at
+# most a few queue "rounds" beyond the executor size before returning
+# 503 - not an arbitrary constant the executor can never drain
+_MAX_INFLIGHT = int(os.getenv('MAX_INFLIGHT', _WORKER_THREADS * 4))
+_inflight = 0
+_inflight_lock = threading.Lock()
+
+def _job_done(future):
+    global _inflight
+    with _inflight_lock:
+        _inflight -= 1
+
+def _json_response(payload, status=200):
+    """JSON response via orjson - a few times faster than jsonify"""
+    return app.response_class(orjson.dumps(payload), status=status,
+                              mimetype='application/json')
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "timestamp": datetime.utcnow().isoformat()}), 200
+    return _json_response({"status": "healthy", "timestamp": datetime.utcnow().isoformat()})
 
 @app.route('/api-endpoint', methods=['POST'])
 def api_endpoint():
@@ -54,11 +115,15 @@ def api_endpoint():
     """
     try:
         # Parse incoming JSON
-        data = request.get_json()
+        raw = request.get_data()
+        try:
+            data = orjson.loads(raw) if raw else None
+        except orjson.JSONDecodeError:
+            data = None
 
         if not data:
             logger.error("No JSON data received")
-            return jsonify({"error": "No JSON data provided"}), 400
+            return _json_response({"error": "No JSON data provided"}, 400)
 
         # Log the request (without sensitive data)
         logger.info(f"Received request for task: {data.get('task', 'unknown')}")
@@ -69,15 +134,15 @@ def api_endpoint():
 
         if missing_fields:
             logger.error(f"Missing required fields: {missing_fields}")
-            return jsonify({
+            return _json_response({
                 "error": "Missing required fields",
                 "missing": missing_fields
-            }), 400
+            }, 400)
 
         # Check secret
         if data['secret'] != config.SHARED_SECRET:
             logger.warning(f"Invalid secret for task: {data['task']}")
-            return jsonify({"error": "Invalid secret"}), 403
+            return _json_response({"error": "Invalid secret"}, 403)
 
         # Send immediate 200 response
         response_data = {
@@ -87,20 +152,25 @@ def api_endpoint():
             "timestamp": datetime.utcnow().isoformat()
         }
 
-        # Process the request asynchronously
-        thread = threading.Thread(
-            target=process_request_async,
-            args=(data,)
-        )
-        thread.start()
+        # Reject early if the deployment backlog is already full
+        global _inflight
+        with _inflight_lock:
+            if _inflight >= _MAX_INFLIGHT:
+                logger.warning(f"Backlog full, rejecting task: {data['task']}")
+                return _json_response({"error": "Server busy, try again later"}, 503)
+            _inflight += 1
+
+        # Process the request asynchronously on the background event loop
+        future = asyncio.run_coroutine_threadsafe(process_request_async(data), _loop)
+        future.add_done_callback(_job_done)
 
-        return jsonify(response_data), 200
+        return _json_response(response_data)
 
     except Exception as e:
         logger.error(f"Error processing request: {str(e)}", exc_info=True)
-        return jsonify({"error": "Internal server error"}), 500
+        return _json_response({"error": "Internal server error"}, 500)
 
-def process_request_async(data):
+async def process_request_async(data):
     """
     Process the request asynchronously:
     1. Generate app using LLM
@@ -108,6 +178,9 @@ def process_request_async(data):
     3. Push code
     4. Enable GitHub Pages
     5. Submit evaluation
+
+    The blocking SDK/subprocess steps (LLM client, PyGithub, git) run in
+    worker threads via asyncio.to_thread; evaluation HTTP is fully async.
     """
     try:
         logger.info(f"Starting async processing for task: {data['task']}")
@@ -117,21 +190,28 @@ def process_request_async(data):
         github_mgr = GitHubManager(config)
         evaluator = Evaluator(config)
 
-        # 1. Generate app code using LLM
-        logger.info("Generating app code using LLM...")
-        app_code = llm_gen.generate_app(data['brief'], data['task'])
-
-        # 2. Create unique repo name based on task
+        # 1+2. Generate app code and create the repo concurrently -
+        # neither step depends on the other's result
         repo_name = f"{data['task']}"
-        logger.info(f"Creating GitHub repo: {repo_name}")
+        logger.info(f"Generating app code and creating repo: {repo_name}")
+        app_code, repo = await asyncio.gather(
+            asyncio.to_thread(llm_gen.generate_app, data['brief'], data['task']),
+            asyncio.to_thread(github_mgr.create_repo, repo_name, data['brief'])
+        )
 
-        # 3. Create repo and push code
-        repo_url, commit_sha, pages_url = github_mgr.create_and_push_repo(
-            repo_name=repo_name,
-            app_code=app_code,
-            task_brief=data['brief']
+        # 3. Push code and enable Pages
+        repo_url, commit_sha, pages_url = await asyncio.to_thread(
+            github_mgr.push_app,
+            repo,
+            repo_name,
+            app_code,
+            data['brief']
         )
 
+        # The Pages build wait is mostly sleeping, so it runs as a
+        # coroutine rather than occupying a worker thread
+        await github_mgr.wait_for_pages(pages_url)
+
         logger.info(f"Repo created: {repo_url}")
         logger.info(f"Commit SHA: {commit_sha}")
         logger.info(f"Pages URL: {pages_url}")
@@ -151,7 +231,7 @@ def process_request_async(data):
         evaluation_url = data.get('evaluation', {}).get('url')
         if evaluation_url:
             logger.info(f"Submitting evaluation to: {evaluation_url}")
-            success = evaluator.submit_evaluation(evaluation_url, eval_data)
+            success = await evaluator.submit_evaluation(evaluation_url, eval_data)
 
             if success:
                 logger.info(f"Evaluation submitted successfully for task: {data['task']}")
@@ -8,34 +8,47 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class Config:
-    """Application configuration"""
-
-    # Server configuration
-    DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
-    PORT = int(os.getenv('PORT', 5000))
-
-    # Security
-    SHARED_SECRET = os.getenv('SHARED_SECRET', 'your-secret-from-google-form')
-
-    # GitHub configuration
-    GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
-    GITHUB_USERNAME = os.getenv('GITHUB_USERNAME')
-
-    # LLM configuration (using OpenAI as example, can be adapted)
-    LLM_API_KEY = os.getenv('LLM_API_KEY')  # OpenAI, Anthropic, etc.
-    LLM_MODEL = os.getenv('LLM_MODEL', 'gpt-4')
-    LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'openai')  # openai, anthropic, local
-
-    # Repository settings
-    DEFAULT_LICENSE = 'MIT'
-    DEFAULT_BRANCH = 'main'
-
-    # Retry settings for evaluation submission
-    MAX_RETRIES = 5
-    INITIAL_RETRY_DELAY = 1  # seconds
-
-    # Timeout settings
-    PROCESSING_TIMEOUT = 600  # 10 minutes
+    """Application configuration
+
+    Every environment lookup happens once at construction; request-time
+    code only ever reads plain attributes, and __slots__ keeps the
+    instance from growing ad-hoc state.
+    """
+
+    __slots__ = (
+        'DEBUG', 'PORT', 'SHARED_SECRET', 'GITHUB_TOKEN', 'GITHUB_USERNAME',
+        'LLM_API_KEY', 'LLM_MODEL', 'LLM_PROVIDER', 'DEFAULT_LICENSE',
+        'DEFAULT_BRANCH', 'MAX_RETRIES', 'INITIAL_RETRY_DELAY',
+        'PROCESSING_TIMEOUT',
+    )
+
+    def __init__(self):
+        # Server configuration
+        self.DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
+        self.PORT = int(os.getenv('PORT', 5000))
+
+        # Security
+        self.SHARED_SECRET = os.getenv('SHARED_SECRET', 'your-secret-from-google-form')
+
+        # GitHub configuration
+        self.GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+        self.GITHUB_USERNAME = os.getenv('GITHUB_USERNAME')
+
+        # LLM configuration (using OpenAI as example, can be adapted)
+        self.LLM_API_KEY = os.getenv('LLM_API_KEY')  # OpenAI, Anthropic, etc.
+        self.LLM_MODEL = os.getenv('LLM_MODEL', 'gpt-4')
+        self.LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'openai')  # openai, anthropic, local
+
+        # Repository settings
+        self.DEFAULT_LICENSE = 'MIT'
+        self.DEFAULT_BRANCH = 'main'
+
+        # Retry settings for evaluation submission
+        self.MAX_RETRIES = 5
+        self.INITIAL_RETRY_DELAY = 1  # seconds
+
+        # Timeout settings
+        self.PROCESSING_TIMEOUT = 600  # 10 minutes
 
     def validate(self):
         """Validate that all required configuration is present"""
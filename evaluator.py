@@ -2,20 +2,41 @@
 Evaluation submission with retry logic
 """
 
+import asyncio
 import logging
-import requests
-import time
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# One HTTP/2 client shared by every evaluation: concurrent submissions
+# multiplex as streams over a single TCP/TLS connection instead of each
+# opening its own. Created lazily so it binds to the worker event loop.
+_CLIENT = None
+
+def _client():
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={'Content-Type': 'application/json'}
+        )
+    return _CLIENT
+
 class Evaluator:
     def __init__(self, config):
         self.config = config
 
-    def submit_evaluation(self, evaluation_url, eval_data):
+    async def submit_evaluation(self, evaluation_url, eval_data):
         """
         Submit evaluation with exponential backoff retry
 
+        All attempts go through the shared HTTP/2 client, so retries reuse
+        the existing connection and the waits between attempts yield the
+        event loop instead of blocking a thread.
+
         Args:
             evaluation_url: URL to POST evaluation data
             eval_data: Dictionary containing evaluation data
@@ -25,17 +46,13 @@ class Evaluator:
         """
         max_retries = self.config.MAX_RETRIES
         delay = self.config.INITIAL_RETRY_DELAY
+        body = orjson.dumps(eval_data)
 
         for attempt in range(max_retries):
             try:
                 logger.info(f"Submitting evaluation (attempt {attempt + 1}/{max_retries})")
 
-                response = requests.post(
-                    evaluation_url,
-                    json=eval_data,
-                    headers={'Content-Type': 'application/json'},
-                    timeout=30
-                )
+                response = await _client().post(evaluation_url, content=body)
 
                 if response.status_code == 200:
                     logger.info("Evaluation submitted successfully!")
@@ -43,13 +60,13 @@ class Evaluator:
                 else:
                     logger.warning(f"Evaluation submission failed: {response.status_code} - {response.text}")
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.error(f"Request error: {str(e)}")
 
             # If not the last attempt, wait and retry
             if attempt < max_retries - 1:
                 logger.info(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
+                await asyncio.sleep(delay)
                 delay *= 2  # Exponential backoff: 1, 2, 4, 8, ...
 
         logger.error("Failed to submit evaluation after all retries")
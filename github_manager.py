@@ -3,89 +3,32 @@ GitHub repository management
 """
 
 import os
+import asyncio
 import subprocess
 import logging
+import base64
+import shlex
 import tempfile
 import shutil
 from github import Github, GithubException
 import time
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
-class GitHubManager:
-    def __init__(self, config):
-        self.config = config
-        self.github = Github(config.GITHUB_TOKEN)
-        self.user = self.github.get_user()
-
-    def create_and_push_repo(self, repo_name, app_code, task_brief):
-        try:
-            temp_dir = tempfile.mkdtemp()
-            logger.info(f"Created temp directory: {temp_dir}")
-
-            try:
-                repo = self._create_github_repo(repo_name, task_brief)
-                self._init_local_repo(temp_dir)
-                self._write_app_files(temp_dir, app_code)
-                self._add_license(temp_dir)
-                self._create_readme(temp_dir, repo_name, task_brief, app_code)
-                commit_sha = self._commit_and_push(temp_dir, repo)
-                pages_url = self._enable_github_pages(repo)
-                self._wait_for_pages(pages_url)
-
-                logger.info(f"Successfully completed! Repo: {repo.html_url}")
-                return repo.html_url, commit_sha, pages_url
-            finally:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        except Exception as e:
-            logger.error(f"Error: {str(e)}", exc_info=True)
-            raise
-
-    def _create_github_repo(self, repo_name, description):
-        try:
-            try:
-                existing_repo = self.user.get_repo(repo_name)
-                logger.warning(f"Repo {repo_name} already exists, deleting...")
-                existing_repo.delete()
-                time.sleep(2)
-            except GithubException:
-                pass
-
-            repo = self.user.create_repo(
-                name=repo_name,
-                description=description[:100] if description else "LLM-generated app",
-                private=False,
-                auto_init=False
-            )
-            logger.info(f"Created repo: {repo.html_url}")
-            return repo
-        except GithubException as e:
-            logger.error(f"GitHub API error: {str(e)}")
-            raise
+# Repos up to this many files are pushed through the Contents API (one PUT
+# per file); bigger ones go through a local git repo and a single push
+_CONTENTS_API_MAX_FILES = 3
 
-    def _init_local_repo(self, repo_dir):
-        subprocess.run(['git', 'init'], cwd=repo_dir, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', self.config.GITHUB_USERNAME], 
-                      cwd=repo_dir, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.email', 
-                       f'{self.config.GITHUB_USERNAME}@users.noreply.github.com'], 
-                      cwd=repo_dir, check=True, capture_output=True)
-        subprocess.run(['git', 'checkout', '-b', self.config.DEFAULT_BRANCH], 
-                      cwd=repo_dir, check=True, capture_output=True)
+# LICENSE and README boilerplate is static per process - build the
+# templates (and the copyright year) once at import instead of
+# reassembling the full text on every request
+_YEAR = time.strftime("%Y")
 
-    def _write_app_files(self, repo_dir, app_code):
-        for filename, content in app_code.items():
-            filepath = os.path.join(repo_dir, filename)
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            logger.info(f"Wrote file: {filename}")
-
-    def _add_license(self, repo_dir):
-        mit = f"""MIT License
+_MIT_TEMPLATE = """MIT License
 
-Copyright (c) {time.strftime("%Y")} {self.config.GITHUB_USERNAME}
+Copyright (c) {year} {user}
 
 Permission is hereby granted, free of charge, to any person obtaining a copy
 of this software and associated documentation files (the "Software"), to deal
@@ -105,27 +48,23 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-        with open(os.path.join(repo_dir, 'LICENSE'), 'w') as f:
-            f.write(mit)
-        logger.info("Added MIT LICENSE")
 
-    def _create_readme(self, repo_dir, repo_name, task_brief, app_code):
-        readme = f"""# {repo_name}
+_README_TEMPLATE = """# {repo}
 
 ## Summary
 LLM-generated web application.
 
-**Brief:** {task_brief}
+**Brief:** {brief}
 
-**Live Demo:** https://{self.config.GITHUB_USERNAME}.github.io/{repo_name}/
+**Live Demo:** https://{user}.github.io/{repo}/
 
 ## Setup
 This is a static web app. To run locally:
 
 ```bash
 # Clone the repository
-git clone https://github.com/{self.config.GITHUB_USERNAME}/{repo_name}.git
-cd {repo_name}
+git clone https://github.com/{user}/{repo}.git
+cd {repo}
 
 # Open in browser
 open index.html
@@ -135,11 +74,8 @@ python -m http.server 8000
 ```
 
 ## Files
-"""
-        for filename in sorted(app_code.keys()):
-            readme += f"- `{filename}`: Application file\n"
+{files}
 
-        readme += f"""
 ## Usage
 Open `index.html` in your web browser.
 
@@ -147,27 +83,163 @@ Open `index.html` in your web browser.
 MIT License - See LICENSE file for details.
 
 ## Generated
-Generated on {time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())} using LLM technology.
+Generated on {generated} using LLM technology.
 """
 
-        with open(os.path.join(repo_dir, 'README.md'), 'w') as f:
-            f.write(readme)
-        logger.info("Created README.md")
+# The Github client and authenticated user are shared across all
+# GitHubManager instances - credentials don't change between requests, so
+# the get_user() round-trip only has to happen once per process
+_GH = None
+_USER = None
 
-    def _commit_and_push(self, repo_dir, repo):
-        subprocess.run(['git', 'add', '.'], cwd=repo_dir, check=True, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', 'Initial commit: LLM-generated application'], 
-                      cwd=repo_dir, check=True, capture_output=True)
+def _github_user(config):
+    global _GH, _USER
+    if _GH is None:
+        _GH = Github(config.GITHUB_TOKEN, per_page=100, pool_size=20)
+        _USER = _GH.get_user()
+    return _GH, _USER
 
-        result = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                              cwd=repo_dir, check=True, capture_output=True, text=True)
-        commit_sha = result.stdout.strip()
+class GitHubManager:
+    def __init__(self, config):
+        self.config = config
+        self.github, self.user = _github_user(config)
+        # One keep-alive session for the direct REST calls (Pages API and
+        # Pages polling) so repeated requests don't redo the TLS handshake
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(pool_maxsize=20))
+
+    def create_repo(self, repo_name, task_brief):
+        """Create (or recreate) the GitHub repo for this task"""
+        return self._create_github_repo(repo_name, task_brief)
+
+    def push_app(self, repo, repo_name, app_code, task_brief):
+        """Push generated files to an existing repo and enable Pages"""
+        try:
+            files = dict(app_code)
+            files['LICENSE'] = self._license_text()
+            files['README.md'] = self._readme_text(repo_name, task_brief, app_code)
+
+            if len(files) <= _CONTENTS_API_MAX_FILES:
+                commit_sha = self._upload_via_contents_api(repo, files)
+            else:
+                # Prefer tmpfs for the working copy - the directory is
+                # rmtree'd moments later, so disk durability buys nothing
+                temp_dir = tempfile.mkdtemp(
+                    dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+                logger.info(f"Created temp directory: {temp_dir}")
+                try:
+                    self._write_app_files(temp_dir, files)
+                    commit_sha = self._commit_and_push(temp_dir, repo)
+                finally:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+
+            pages_url = self._enable_github_pages(repo)
+
+            logger.info(f"Successfully completed! Repo: {repo.html_url}")
+            return repo.html_url, commit_sha, pages_url
+        except Exception as e:
+            logger.error(f"Error: {str(e)}", exc_info=True)
+            raise
+
+    def _create_github_repo(self, repo_name, description):
+        try:
+            try:
+                existing_repo = self.user.get_repo(repo_name)
+                logger.warning(f"Repo {repo_name} already exists, deleting...")
+                existing_repo.delete()
+                time.sleep(2)
+            except GithubException:
+                pass
 
+            repo = self.user.create_repo(
+                name=repo_name,
+                description=description[:100] if description else "LLM-generated app",
+                private=False,
+                auto_init=False
+            )
+            logger.info(f"Created repo: {repo.html_url}")
+            return repo
+        except GithubException as e:
+            logger.error(f"GitHub API error: {str(e)}")
+            raise
+
+    def _write_app_files(self, repo_dir, app_code):
+        # Create each distinct directory once, then write each file with a
+        # raw open/write/close - skips the TextIOWrapper/BufferedWriter
+        # layers and the repeated makedirs stat per file
+        dirnames = {os.path.dirname(os.path.join(repo_dir, name)) for name in app_code}
+        for dirname in dirnames:
+            os.makedirs(dirname, exist_ok=True)
+
+        for filename, content in app_code.items():
+            filepath = os.path.join(repo_dir, filename)
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, content.encode('utf-8'))
+            finally:
+                os.close(fd)
+            logger.info(f"Wrote file: {filename}")
+
+    def _upload_via_contents_api(self, repo, files):
+        """Push files with one PUT each via the Contents API - no temp
+        directory, local clone or git subprocesses needed"""
+        headers = {
+            'Authorization': f'token {self.config.GITHUB_TOKEN}',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+
+        commit_sha = None
+        for filename, content in files.items():
+            url = (f"https://api.github.com/repos/"
+                   f"{self.config.GITHUB_USERNAME}/{repo.name}/contents/{filename}")
+            response = self.http.put(url, json={
+                'message': 'Initial commit: LLM-generated application',
+                'content': base64.b64encode(content.encode('utf-8')).decode('ascii'),
+                'branch': self.config.DEFAULT_BRANCH
+            }, headers=headers, timeout=30)
+            response.raise_for_status()
+            commit_sha = response.json()['commit']['sha']
+            logger.info(f"Uploaded file: {filename}")
+
+        logger.info(f"Pushed commit: {commit_sha}")
+        return commit_sha
+
+    def _license_text(self):
+        return _MIT_TEMPLATE.format(year=_YEAR, user=self.config.GITHUB_USERNAME)
+
+    def _readme_text(self, repo_name, task_brief, app_code):
+        file_list = '\n'.join(f"- `{name}`: Application file" for name in sorted(app_code))
+        return _README_TEMPLATE.format(
+            repo=repo_name,
+            brief=task_brief,
+            user=self.config.GITHUB_USERNAME,
+            files=file_list,
+            generated=time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+        )
+
+    def _commit_and_push(self, repo_dir, repo):
+        # Run the whole init -> push sequence in one shell invocation
+        # instead of a separate fork/exec per git command. Identity and
+        # fsync settings ride along as -c flags, the branch is set at
+        # init time, and the push goes straight to the remote URL, so no
+        # config/checkout/remote-add commands are needed at all. The
+        # fsync barriers are skipped because the repo is throwaway.
         remote_url = f"https://{self.config.GITHUB_TOKEN}@github.com/{self.config.GITHUB_USERNAME}/{repo.name}.git"
-        subprocess.run(['git', 'remote', 'add', 'origin', remote_url], 
-                      cwd=repo_dir, check=True, capture_output=True)
-        subprocess.run(['git', 'push', '-u', 'origin', self.config.DEFAULT_BRANCH], 
-                      cwd=repo_dir, check=True, capture_output=True)
+        branch = shlex.quote(self.config.DEFAULT_BRANCH)
+        git = ('git -c core.fsync=none'
+               f' -c user.name={shlex.quote(self.config.GITHUB_USERNAME)}'
+               f' -c user.email={shlex.quote(self.config.GITHUB_USERNAME)}@users.noreply.github.com')
+        script = ' && '.join([
+            f'{git} init -q -b {branch}',
+            f'{git} add .',
+            f"{git} commit -q -m 'Initial commit: LLM-generated application'",
+            f'{git} push -q {shlex.quote(remote_url)} {branch}',
+            f'{git} rev-parse HEAD',
+        ])
+        result = subprocess.run(['sh', '-c', script], cwd=repo_dir, check=True,
+                                capture_output=True, text=True,
+                                env={**os.environ, 'GIT_OPTIONAL_LOCKS': '0'})
+        commit_sha = result.stdout.strip()
 
         logger.info(f"Pushed commit: {commit_sha}")
         return commit_sha
@@ -194,7 +266,7 @@ Generated on {time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())} using LLM t
                     }
                 }
 
-                response = requests.post(api_url, json=data, headers=headers)
+                response = self.http.post(api_url, json=data, headers=headers)
 
                 if response.status_code in [201, 409]:  # 201 = created, 409 = already exists
                     if response.status_code == 201:
@@ -229,16 +301,25 @@ Generated on {time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())} using LLM t
             logger.info(f"Expected Pages URL: {pages_url}")
             return pages_url
 
-    def _wait_for_pages(self, pages_url, max_wait=120):
-        """Wait for GitHub Pages to become available"""
+    async def wait_for_pages(self, pages_url, max_wait=120):
+        """Wait for GitHub Pages to become available
+
+        Runs as a coroutine - the wait is almost entirely sleeping, so it
+        must not occupy a worker thread for its duration; only the short
+        HEAD probes hop onto the executor.
+        """
         logger.info("Waiting for GitHub Pages to be ready...")
         logger.info("Note: GitHub Pages can take 2-5 minutes to build")
 
         start_time = time.time()
+        delay = 2
 
         while time.time() - start_time < max_wait:
             try:
-                response = requests.get(pages_url, timeout=10)
+                # HEAD is enough to check the status code - no need to
+                # download the whole page body on every probe
+                response = await asyncio.to_thread(
+                    self.http.head, pages_url, timeout=5, allow_redirects=True)
                 if response.status_code == 200:
                     logger.info(f"✅ GitHub Pages is live at: {pages_url}")
                     return True
@@ -246,10 +327,10 @@ Generated on {time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())} using LLM t
                 pass
 
             elapsed = int(time.time() - start_time)
-            if elapsed % 15 == 0 and elapsed > 0:
-                logger.info(f"Still waiting... ({elapsed}s elapsed)")
+            logger.info(f"Still waiting... ({elapsed}s elapsed, next check in {delay}s)")
 
-            time.sleep(5)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30)  # Exponential backoff: 2, 4, 8, 16, 30, 30, ...
 
         logger.warning(f"GitHub Pages not ready after {max_wait}s")
         logger.info("This is normal - Pages can take a few minutes to build")
@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for production deployments
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', 4))
+
+# gthread rather than gevent: the gevent worker monkey-patches the stdlib,
+# which would break the background asyncio loop the app dispatches
+# deployments onto. The endpoint handlers are short (validate + schedule),
+# so a thread pool per worker is plenty.
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 16))
+worker_connections = 1000
+
+timeout = 600
+accesslog = '-'
@@ -3,12 +3,39 @@ LLM-based application code generation
 """
 
 import logging
+import hashlib
+import string
 import openai
 import anthropic
 import json
 
 logger = logging.getLogger(__name__)
 
+# Responses cached by (provider, model, prompt) hash. Module-level so the
+# cache survives the per-request LLMGenerator instances; safe because
+# generation runs at temperature=0 and is therefore deterministic.
+_RESPONSE_CACHE = {}
+
+# Semantic cache: briefs that are rewordings of an earlier one ("simple
+# captcha solver" vs "a basic captcha solver UI") reuse the app generated
+# for that brief when their embeddings have cosine similarity above the
+# threshold. Disabled automatically if sentence-transformers is missing.
+_SIMILARITY_THRESHOLD = 0.92
+_EMB_INDEX = []  # list of (normalized embedding, app_code) pairs
+_EMB_MODEL = None
+
+def _embedding_model():
+    """Lazily load the local embedding model, or None if unavailable"""
+    global _EMB_MODEL
+    if _EMB_MODEL is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+            _EMB_MODEL = SentenceTransformer('all-MiniLM-L6-v2')
+        except ImportError:
+            logger.warning("sentence-transformers not installed, semantic cache disabled")
+            _EMB_MODEL = False
+    return _EMB_MODEL or None
+
 class LLMGenerator:
     def __init__(self, config):
         self.config = config
@@ -25,13 +52,58 @@ class LLMGenerator:
 
         prompt = self._create_prompt(brief, task_name)
 
+        key = hashlib.sha256(
+            f"{self.provider}|{self.config.LLM_MODEL}|{prompt}".encode()
+        ).hexdigest()
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            logger.info(f"LLM cache hit for: {task_name}")
+            return cached
+
+        embedding = self._embed_brief(brief)
+        similar = self._semantic_lookup(embedding)
+        if similar is not None:
+            logger.info(f"Semantic cache hit for: {task_name}")
+            return similar
+
         if self.provider == 'openai':
-            return self._generate_with_openai(prompt)
+            app_code = self._generate_with_openai(prompt)
         elif self.provider == 'anthropic':
-            return self._generate_with_anthropic(prompt)
+            app_code = self._generate_with_anthropic(prompt)
         else:
             return self._generate_simple_app(brief, task_name)
 
+        if app_code is None:
+            # Provider error or unusable output - serve the fallback but
+            # never cache it, or retries would replay the junk forever
+            return self._generate_simple_app(brief, task_name)
+
+        _RESPONSE_CACHE[key] = app_code
+        if embedding is not None:
+            _EMB_INDEX.append((embedding, app_code))
+        return app_code
+
+    def _embed_brief(self, brief):
+        """Embed the brief for similarity lookup, or None if disabled"""
+        model = _embedding_model()
+        if model is None:
+            return None
+        return model.encode(brief, normalize_embeddings=True)
+
+    def _semantic_lookup(self, embedding):
+        """Return a cached app whose brief is near-identical to this one"""
+        if embedding is None or not _EMB_INDEX:
+            return None
+
+        import numpy as np
+        matrix = np.stack([emb for emb, _ in _EMB_INDEX])
+        similarities = matrix @ embedding  # embeddings are normalized, so dot = cosine
+        best = int(np.argmax(similarities))
+
+        if similarities[best] >= _SIMILARITY_THRESHOLD:
+            return _EMB_INDEX[best][1]
+        return None
+
     def _create_prompt(self, brief, task_name):
         return f"""Generate a complete, minimal web application based on this brief:
 
@@ -61,69 +133,95 @@ Important: The HTML must be complete and self-contained. Include all styles in a
                     {"role": "system", "content": "You are an expert web developer. Generate clean, professional code."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7
+                temperature=0,
+                stream=True
             )
 
-            content = response.choices[0].message.content
-            return self._parse_llm_response(content)
+            # Accumulate tokens as they arrive instead of waiting for the
+            # whole completion to be buffered server-side
+            chunks = []
+            for chunk in response:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+
+            return self._parse_llm_response(''.join(chunks))
 
         except Exception as e:
             logger.error(f"OpenAI API error: {str(e)}")
-            return self._generate_simple_app(prompt, "fallback")
+            return None
 
     def _generate_with_anthropic(self, prompt):
         try:
-            response = self.client.messages.create(
+            chunks = []
+            with self.client.messages.stream(
                 model=self.config.LLM_MODEL,
                 max_tokens=4000,
+                temperature=0,
                 messages=[{"role": "user", "content": prompt}]
-            )
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
 
-            content = response.content[0].text
-            return self._parse_llm_response(content)
+            return self._parse_llm_response(''.join(chunks))
 
         except Exception as e:
             logger.error(f"Anthropic API error: {str(e)}")
-            return self._generate_simple_app(prompt, "fallback")
+            return None
 
     def _parse_llm_response(self, content):
-        """Parse LLM response and extract code"""
-        try:
-            # Try to find JSON in the response
-            start = content.find('{')
-            end = content.rfind('}') + 1
-
-            if start >= 0 and end > start:
-                json_str = content[start:end]
-                return json.loads(json_str)
-
-            # If no JSON found, wrap content as HTML
+        """Parse LLM response and extract code, or None if unusable"""
+        # Attempt a real parse at each '{' with raw_decode - unlike the
+        # old find/rfind slicing this tolerates prose or code fences
+        # around the object and stray braces before it
+        decoder = json.JSONDecoder()
+        index = content.find('{')
+
+        while index != -1:
+            try:
+                obj, _ = decoder.raw_decode(content, index)
+                # Only a plausible file map counts - raw HTML and prose
+                # routinely contain parseable-but-bogus objects (the {}
+                # in "() => {}", a JSON.parse('...') literal), so require
+                # a non-empty dict of filename-like keys to string values
+                # and keep scanning otherwise
+                if obj and isinstance(obj, dict) and all(
+                        isinstance(k, str) and '.' in k and isinstance(v, str)
+                        for k, v in obj.items()):
+                    return obj
+            except json.JSONDecodeError:
+                pass
+            index = content.find('{', index + 1)
+
+        # No JSON object. Raw HTML is still usable model output; anything
+        # else (refusals, "overloaded" prose) is not - return None so the
+        # caller serves the fallback without caching it
+        if '<html' in content.lower():
             return {"index.html": content}
 
-        except json.JSONDecodeError:
-            logger.warning("Could not parse JSON from LLM response")
-            # Return content as HTML
-            if '<html' in content.lower():
-                return {"index.html": content}
-            else:
-                return self._generate_simple_app("fallback", "error")
+        logger.warning("Could not parse JSON from LLM response")
+        return None
 
     def _generate_simple_app(self, brief, task_name):
         """Generate a simple fallback app"""
-        html = f"""<!DOCTYPE html>
+        return {"index.html": _FALLBACK_TPL.substitute(task_name=task_name, brief=brief[:200])}
+
+# Fallback page built once at import as a string.Template - substitution
+# only scans for $ placeholders, so the CSS/JS braces need no doubling
+_FALLBACK_TPL = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{task_name}</title>
+    <title>$task_name</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             line-height: 1.6;
             color: #333;
@@ -133,46 +231,46 @@ Important: The HTML must be complete and self-contained. Include all styles in a
             justify-content: center;
             align-items: center;
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             background: white;
             padding: 40px;
             border-radius: 10px;
             box-shadow: 0 10px 40px rgba(0,0,0,0.2);
             max-width: 600px;
             width: 100%;
-        }}
+        }
 
-        h1 {{
+        h1 {
             color: #667eea;
             margin-bottom: 20px;
             font-size: 2em;
-        }}
+        }
 
-        .content {{
+        .content {
             margin: 20px 0;
-        }}
+        }
 
-        .input-group {{
+        .input-group {
             margin: 20px 0;
-        }}
+        }
 
-        input, textarea {{
+        input, textarea {
             width: 100%;
             padding: 12px;
             border: 2px solid #e0e0e0;
             border-radius: 5px;
             font-size: 16px;
             transition: border-color 0.3s;
-        }}
+        }
 
-        input:focus, textarea:focus {{
+        input:focus, textarea:focus {
             outline: none;
             border-color: #667eea;
-        }}
+        }
 
-        button {{
+        button {
             background: #667eea;
             color: white;
             border: none;
@@ -181,30 +279,30 @@ Important: The HTML must be complete and self-contained. Include all styles in a
             font-size: 16px;
             cursor: pointer;
             transition: background 0.3s;
-        }}
+        }
 
-        button:hover {{
+        button:hover {
             background: #764ba2;
-        }}
+        }
 
-        .result {{
+        .result {
             margin-top: 20px;
             padding: 15px;
             background: #f5f5f5;
             border-radius: 5px;
             display: none;
-        }}
+        }
 
-        .result.show {{
+        .result.show {
             display: block;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
-        <h1>{task_name}</h1>
+        <h1>$task_name</h1>
         <div class="content">
-            <p><strong>Task Brief:</strong> {brief[:200]}...</p>
+            <p><strong>Task Brief:</strong> $brief...</p>
         </div>
 
         <div class="input-group">
@@ -217,28 +315,27 @@ Important: The HTML must be complete and self-contained. Include all styles in a
     </div>
 
     <script>
-        function processInput() {{
+        function processInput() {
             const input = document.getElementById('userInput').value;
             const result = document.getElementById('result');
 
-            if (input.trim() === '') {{
+            if (input.trim() === '') {
                 result.textContent = 'Please enter something!';
                 result.style.background = '#ffe0e0';
-            }} else {{
+            } else {
                 result.textContent = 'Processed: ' + input;
                 result.style.background = '#e0ffe0';
-            }}
+            }
 
             result.classList.add('show');
-        }}
+        }
 
-        document.getElementById('userInput').addEventListener('keypress', function(e) {{
-            if (e.key === 'Enter') {{
+        document.getElementById('userInput').addEventListener('keypress', function(e) {
+            if (e.key === 'Enter') {
                 processInput();
-            }}
-        }});
+            }
+        });
     </script>
 </body>
 </html>
-"""
-        return {"index.html": html}
+""")
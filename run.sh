@@ -32,6 +32,6 @@ fi
 mkdir -p logs
 
 # Run the application
-echo "✅ Starting Flask server..."
+echo "✅ Starting server..."
 echo ""
-python app.py
+gunicorn -c gunicorn_conf.py app:app